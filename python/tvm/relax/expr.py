@@ -54,19 +54,29 @@ class ShapeExpr(Expr):
         span: Span = None,
     ) -> None:
         self.__init_handle_by_constructor__(_ffi_api.ShapeExpr, values, span)  # type: ignore
+        self._len = len(values)
 
     def __getitem__(self, index):
+        values = self.values
         if index >= len(self):
             raise IndexError("Tuple index out of range")
-        return self.values[index]
+        return values[index]
 
     def __len__(self):
-        return len(self.values)
+        # ShapeExprs returned from the FFI do not go through __init__,
+        # so fill the cache lazily on first use.
+        length = self.__dict__.get("_len")
+        if length is None:
+            length = self._len = len(self.values)
+        return length
 
 
-def make_shape(shape: Union[List[Any], typing.Tuple[Any, ...]]) -> ShapeExpr:
-    if isinstance(shape, (list, tuple)):
+def make_shape(shape: Union[List[Any], typing.Tuple[Any, ...], ShapeExpr]) -> ShapeExpr:
+    shape_type = type(shape)
+    if shape_type is list or shape_type is tuple:
         return ShapeExpr(shape)
+    if isinstance(shape, ShapeExpr):
+        return shape
     raise ValueError("Wrong type")
 
 
@@ -78,6 +88,28 @@ class RuntimeDepShape(Expr):
         self.__init_handle_by_constructor__(_ffi_api.RuntimeDepShape, span)  # type: ignore
 
 
+# (constructor from a str name hint, constructor from an Id)
+_VAR_CTORS = (_ffi_api.Var, _ffi_api.VarFromId)  # type: ignore
+_DATAFLOW_VAR_CTORS = (_ffi_api.DataflowVar, _ffi_api.DataflowVarFromId)  # type: ignore
+
+
+def _init_var(
+    var: "Var",
+    ctors: typing.Tuple[Any, Any],
+    name_hint: Union[str, Id],
+    shape_annotation: Optional[Union[List[Any], typing.Tuple[Any, ...], ShapeExpr]],
+    type_annotation: Optional[Type],
+    span: Span,
+) -> None:
+    """Shared constructor body of Var and DataflowVar."""
+    shape_type = type(shape_annotation)
+    if shape_type is list or shape_type is tuple:
+        shape_annotation = ShapeExpr(shape_annotation)  # type: ignore
+    # tvm.runtime.String subclasses str, so an exact type check is not enough here.
+    ctor = ctors[0] if isinstance(name_hint, str) else ctors[1]
+    var.__init_handle_by_constructor__(ctor, name_hint, shape_annotation, type_annotation, span)
+
+
 @tvm._ffi.register_object("relax.expr.Var")
 class Var(Expr):
     """The variable class for all Relax bindings."""
@@ -92,20 +124,15 @@ class Var(Expr):
         type_annotation: Optional[Type] = None,
         span: Span = None,
     ) -> None:
-        if isinstance(shape_annotation, (list, tuple)):
-            shape_annotation = make_shape(shape_annotation)
-        self.__init_handle_by_constructor__(
-            _ffi_api.Var if isinstance(name_hint, str) else _ffi_api.VarFromId,  # type: ignore
-            name_hint,
-            shape_annotation,
-            type_annotation,
-            span,
-        )
+        _init_var(self, _VAR_CTORS, name_hint, shape_annotation, type_annotation, span)
 
     @property
     def name_hint(self):
         """Get name hint of the current var."""
-        name = str(self.vid.name_hint)
+        # Vars are immutable, so the name is cached on the Python wrapper.
+        name = self.__dict__.get("_name_hint")
+        if name is None:
+            name = self._name_hint = str(self.vid.name_hint)
         return name
 
     def __call__(self, *args: Any, attrs=None) -> Call:
@@ -127,18 +154,7 @@ class DataflowVar(Var):
         type_annotation: Optional[Type] = None,
         span: Span = None,
     ) -> None:
-        if isinstance(shape_annotation, (list, tuple)):
-            shape_annotation = make_shape(shape_annotation)
-
-        self.__init_handle_by_constructor__(
-            _ffi_api.DataflowVar  # type: ignore
-            if isinstance(name_hint, str)
-            else _ffi_api.DataflowVarFromId,  # type: ignore
-            name_hint,
-            shape_annotation,
-            type_annotation,
-            span,
-        )
+        _init_var(self, _DATAFLOW_VAR_CTORS, name_hint, shape_annotation, type_annotation, span)
 
 
 @tvm._ffi.register_object("relax.expr.Binding")
@@ -203,6 +219,15 @@ class SeqExpr(Expr):
         self.__init_handle_by_constructor__(_ffi_api.SeqExpr, blocks, body, span)  # type: ignore
 
 
+# Resolved eagerly when available; Function.script retries the lookup (and raises)
+# if the printer is not registered, e.g. in a runtime-only build.
+_AS_RELAX_SCRIPT = tvm._ffi.get_global_func("script.AsRelaxScript", allow_missing=True)
+# Resolved on first use by Function.show.
+_CPRINT = None
+# Arrays are immutable, so zero-argument calls can share one argument list.
+_EMPTY_ARGS = tvm.runtime.convert([])
+
+
 @tvm._ffi.register_object("relax.expr.Function")
 class Function(BaseFunc):
     """A Relax function."""
@@ -248,6 +273,8 @@ class Function(BaseFunc):
         args: List[relax.Expr]
             Arguments.
         """
+        if not args:
+            return Call(self, _EMPTY_ARGS, None, None)
         return Call(self, args, None, None)
 
     def script(self, show_meta: bool = False) -> str:
@@ -263,7 +290,10 @@ class Function(BaseFunc):
         script : str
             The TVM Script of the relax.Function
         """
-        return tvm._ffi.get_global_func("script.AsRelaxScript")(self, show_meta)  # type: ignore
+        global _AS_RELAX_SCRIPT  # pylint: disable=global-statement
+        if _AS_RELAX_SCRIPT is None:
+            _AS_RELAX_SCRIPT = tvm._ffi.get_global_func("script.AsRelaxScript")
+        return _AS_RELAX_SCRIPT(self, show_meta)  # type: ignore
 
     def show(self, style: str = "light") -> None:
         """
@@ -274,10 +304,13 @@ class Function(BaseFunc):
         style : str, optional
             Pygments styles extended by "light" (default) and "dark", by default "light"
         """
-        from tvm.script.highlight import cprint  # pylint: disable=import-outside-toplevel
+        global _CPRINT  # pylint: disable=global-statement
+        if _CPRINT is None:
+            # Use deferred import to avoid circular import while keeping cprint under tvm/script
+            from tvm.script.highlight import cprint  # pylint: disable=import-outside-toplevel
 
-        # Use deferred import to avoid circular import while keeping cprint under tvm/script
-        cprint(self, style=style)
+            _CPRINT = cprint
+        _CPRINT(self, style=style)
 
 
 @tvm._ffi.register_object("relax.expr.ExternFunc")
@@ -24,20 +24,28 @@ from .diagnostics import Source
 from .parser import Parser
 
 
+# Built on first use: the dialect modules cannot be imported at module load
+# without a circular import.
+_DEFAULT_EXTRA_VARS = None
+
+
 def parse(program: Union[doc.AST, Any, str], extra_vars=None):
+    global _DEFAULT_EXTRA_VARS  # pylint: disable=global-statement
     if extra_vars is None:
-        from tvm.script._parser import ir  # pylint: disable=import-outside-toplevel
-        from tvm.script._parser import relax  # pylint: disable=import-outside-toplevel
-        from tvm.script._parser import tir  # pylint: disable=import-outside-toplevel
+        if _DEFAULT_EXTRA_VARS is None:
+            from tvm.script._parser import ir  # pylint: disable=import-outside-toplevel
+            from tvm.script._parser import relax  # pylint: disable=import-outside-toplevel
+            from tvm.script._parser import tir  # pylint: disable=import-outside-toplevel
 
-        extra_vars = {
-            "I": ir,
-            "ir": ir,
-            "T": tir,
-            "tir": tir,
-            "relax": relax,
-            "R": relax,
-        }
+            _DEFAULT_EXTRA_VARS = {
+                "I": ir,
+                "ir": ir,
+                "T": tir,
+                "tir": tir,
+                "relax": relax,
+                "R": relax,
+            }
+        extra_vars = _DEFAULT_EXTRA_VARS
 
     source = Source(program)
     parser = Parser(source)
@@ -135,6 +135,20 @@ def test_shape_expr() -> None:
     s = rx.ShapeExpr([m, n])
     assert s.values[0] == m
     assert s.values[1] == n
+    assert len(s) == 2
+    assert s[0] == m
+    assert s[1] == n
+    with pytest.raises(IndexError):
+        s[2]
+
+
+def test_make_shape() -> None:
+    s = rx.expr.make_shape([10, 20])
+    assert isinstance(s, rx.ShapeExpr)
+    assert s.values[0] == 10
+    assert rx.expr.make_shape(s).same_as(s)
+    with pytest.raises(ValueError):
+        rx.expr.make_shape(10)
 
 
 def test_func():